@@ -1,4 +1,33 @@
-from typing import Any
+from time import monotonic
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from maimai_py.maimai import MaimaiSongs
 
-cached_songs: Any | None = None
+
+songs_cache: dict[tuple[type, type | None], tuple["MaimaiSongs", float]] = {}
+songs_cache_size: int = 4
+songs_cache_ttl: float = 3600.0
+
+
+def get_songs(key: tuple[type, type | None] | None = None) -> "MaimaiSongs | None":
+    """Get the fresh cached songs of the (provider, alias_provider) types, or the most recently cached ones of any providers if key is None."""
+    if key is None:
+        candidates = reversed(list(songs_cache.values()))
+    else:
+        candidates = [songs_cache[key]] if key in songs_cache else []
+    now = monotonic()
+    return next((songs for songs, cached_at in candidates if now - cached_at < songs_cache_ttl), None)
+
+
+def put_songs(key: tuple[type, type | None], songs: "MaimaiSongs") -> None:
+    """Cache the songs of the (provider, alias_provider) types, evicting the oldest entries beyond the cache size."""
+    songs_cache.pop(key, None)  # re-insert to move the key to the newest position
+    songs_cache[key] = (songs, monotonic())
+    while len(songs_cache) > songs_cache_size:
+        del songs_cache[next(iter(songs_cache))]
+
+
+def clear_songs() -> None:
+    """Drop all cached songs, the next `MaimaiClient.songs()` call will fetch them from the providers again."""
+    songs_cache.clear()
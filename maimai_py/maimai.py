@@ -1,35 +1,132 @@
+import asyncio
+import bisect
+import heapq
+import operator
+import sys
 from functools import cached_property
-from httpx import AsyncClient
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Any, Iterable
 import httpx
 
 from maimai_ffi import arcade
 from maimai_py import caches, enums
-from maimai_py.enums import FCType, FSType, LevelIndex, RateType, ScoreKind
+from maimai_py.enums import FCType, FSType, LevelIndex, RateType, ScoreKind, SongType
 from maimai_py.exceptions import InvalidPlateError, WechatTokenExpiredError
 from maimai_py.models import ArcadeResponse, DivingFishPlayer, LXNSPlayer, PlateObject, PlayerIdentifier, Score, Song, SongAlias
 from maimai_py.providers import IAliasProvider, IPlayerProvider, ISongProvider, LXNSProvider, YuzuProvider
 from maimai_py.providers.base import IScoreProvider
 
+_default_provider = LXNSProvider()
+"""@private"""
+_default_alias_provider = YuzuProvider()
+"""@private"""
+_http2_available = find_spec("h2") is not None
+"""@private"""
+_wechat_authorize_url = "https://tgk-wcaime.wahlap.com/wc_auth/oauth/authorize/maimai-dx"
+"""@private"""
+_wechat_callback_url = "https://tgk-wcaime.wahlap.com/wc_auth/oauth/callback/maimai-dx"
+"""@private"""
+_wechat_headers = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 6.1; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/81.0.4044.138 Safari/537.36 NetType/WIFI MicroMessenger/7.0.20.1781(0x6700143B) WindowsWechat(0x6307001e)",
+        "Host": "tgk-wcaime.wahlap.com",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
+    }
+)
+"""@private"""
+_plate_to_versions: dict[str, frozenset[int]] = {
+    **{plate: frozenset([ver]) for plate, ver in enums.plate_to_version.items()},
+    "真": frozenset([enums.plate_to_version["初"], enums.plate_to_version["真"]]),
+    "霸": frozenset(ver for ver in enums.plate_to_version.values() if ver < 20000),
+    "舞": frozenset(ver for ver in enums.plate_to_version.values() if ver < 20000),
+}
+"""@private"""
+_plate_predicates = {
+    "者": lambda score: score.rate.value <= RateType.A.value,
+    "将": lambda score: score.rate.value <= RateType.SSS.value,
+    "极": lambda score: score.fc and score.fc.value <= FCType.FC.value,
+    "舞舞": lambda score: score.fs and score.fs.value <= FSType.FSD.value,
+    "神": lambda score: score.fc and score.fc.value <= FCType.AP.value,
+}
+"""@private"""
+
+
+def _filter_by_attributes(items: Iterable[Any], conditions: dict[str, Any]) -> list[Any]:
+    if not conditions:
+        return list(items)
+    # fetch and compare all attributes at once, attrgetter returns a bare value instead of a tuple for a single attribute
+    getter = operator.attrgetter(*conditions)
+    expected = tuple(conditions.values()) if len(conditions) > 1 else next(iter(conditions.values()))
+    return [item for item in items if getter(item) == expected]
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
 
 class MaimaiSongs:
+    __slots__ = ("songs", "_song_id_dict", "_aliases", "_alias_entry_dict", "_alias_entries", "_title_dict", "_artist_dict", "_genre_dict", "_bpm_keys", "_bpm_songs", "_plate_versions")
+
+    songs: tuple[Song, ...]
+    """All songs as tuple."""
     _song_id_dict: dict[int, Song]  # song_id: song
-    _alias_entry_dict: dict[str, int]  # alias_entry: song_id
+    _aliases: list[SongAlias]  # raw aliases, indexed on the first alias lookup
+    _alias_entry_dict: dict[str, int] | None  # alias_entry: song_id
+    _alias_entries: list[str] | None  # sorted alias entries, for prefix searching
+    _title_dict: dict[str, list[Song]]  # title: songs, titles are not unique
+    _artist_dict: dict[str, list[Song]]  # artist: songs
+    _genre_dict: dict[str, list[Song]]  # genre: songs
+    _bpm_keys: list[int]  # sorted bpms, aligned with _bpm_songs
+    _bpm_songs: list[Song]  # songs sorted by bpm
+    _plate_versions: dict[int, frozenset[int]] | None  # song_id: plate versions, built on the first plate
 
     def __init__(self, songs: list[Song], aliases: list[SongAlias] | None) -> None:
         """@private"""
         self._song_id_dict = {song.id: song for song in songs}
-        self._alias_entry_dict = {}
-        for alias in aliases:
-            target_song = self._song_id_dict.get(alias.song_id)
-            if target_song:
+        self.songs = tuple(self._song_id_dict.values())
+        self._title_dict = {}
+        self._artist_dict = {}
+        self._genre_dict = {}
+        # index the songs deduplicated by id, so that the lookups never return a song that is not in self.songs
+        for song in self.songs:
+            # artists and genres repeat a lot, interning them shares one string object per value and speeds up comparisons
+            song.artist = sys.intern(song.artist) if song.artist else song.artist
+            song.genre = sys.intern(song.genre) if song.genre else song.genre
+            self._title_dict.setdefault(song.title, []).append(song)
+            self._artist_dict.setdefault(song.artist, []).append(song)
+            self._genre_dict.setdefault(song.genre, []).append(song)
+        self._bpm_songs = sorted(self.songs, key=lambda song: song.bpm)
+        self._bpm_keys = [song.bpm for song in self._bpm_songs]
+        self._aliases = aliases or []
+        self._alias_entry_dict, self._alias_entries = None, None
+        self._plate_versions = None
+        for alias in self._aliases:
+            if (target_song := self._song_id_dict.get(alias.song_id)) and target_song.aliases is not alias.aliases:
                 target_song.aliases = alias.aliases
-            for alias_entry in alias.aliases:
-                self._alias_entry_dict[alias_entry] = alias.song_id
 
-    @property
-    def songs(self) -> list[Song]:
-        """All songs as list."""
-        return self._song_id_dict.values()
+    def _ensure_alias_index(self) -> None:
+        # the alias index is only needed by alias lookups, build it on the first one
+        if self._alias_entry_dict is None:
+            self._alias_entry_dict = {}
+            for alias in self._aliases:
+                for alias_entry in alias.aliases:
+                    self._alias_entry_dict[alias_entry] = alias.song_id
+            self._alias_entries = sorted(self._alias_entry_dict)
+
+    def _get_plate_versions(self) -> dict[int, frozenset[int]]:
+        # the plate versions that each song counts towards, a chart counts towards a version if its version is less than 100 above it
+        if self._plate_versions is None:
+            all_versions = set(enums.plate_to_version.values())
+            self._plate_versions = {}
+            for song in self.songs:
+                chart_versions = [diffs[0].version for diffs in (song.difficulties.standard, song.difficulties.dx) if diffs != []]
+                self._plate_versions[song.id] = frozenset(ver for ver in all_versions if any(0 <= chart_ver - ver < 100 for chart_ver in chart_versions))
+        return self._plate_versions
 
     def by_id(self, id: int) -> Song | None:
         """Get a song by its ID.
@@ -44,12 +141,25 @@ class MaimaiSongs:
     def by_title(self, title: str) -> Song | None:
         """Get a song by its title.
 
+        Some titles are shared by several songs, only the first one is returned, use `by_title_all` to get all of them.
+
         Args:
             title: the title of the song.
         Returns:
             the song if it exists, otherwise return None.
         """
-        return next((song for song in self.songs if song.title == title), None)
+        songs = self._title_dict.get(title)
+        return songs[0] if songs else None
+
+    def by_title_all(self, title: str) -> list[Song]:
+        """Get all songs that share the title.
+
+        Args:
+            title: the title of the songs.
+        Returns:
+            the list of songs that match the title, return an empty list if no song is found.
+        """
+        return list(self._title_dict.get(title, []))
 
     def by_alias(self, alias: str) -> Song | None:
         """Get song by one possible alias.
@@ -59,8 +169,27 @@ class MaimaiSongs:
         Returns:
             the song if it exists, otherwise return None.
         """
-        song_id = self._alias_entry_dict.get(alias, 0)
-        return self.by_id(song_id)
+        self._ensure_alias_index()
+        song_id = self._alias_entry_dict.get(alias)
+        return self._song_id_dict.get(song_id) if song_id is not None else None
+
+    def by_alias_prefix(self, prefix: str) -> list[Song]:
+        """Get songs by the prefix of their aliases, case-sensitive.
+
+        Args:
+            prefix: the prefix of the aliases, e.g. "不知".
+        Returns:
+            the list of distinct songs that have an alias starting with the prefix, return an empty list if no song is found.
+        """
+        self._ensure_alias_index()
+        results: dict[int, Song] = {}
+        index = bisect.bisect_left(self._alias_entries, prefix)
+        # matched entries are contiguous in the sorted list, stop at the first one that doesn't match
+        while index < len(self._alias_entries) and self._alias_entries[index].startswith(prefix):
+            if song := self._song_id_dict.get(self._alias_entry_dict[self._alias_entries[index]]):
+                results.setdefault(song.id, song)
+            index += 1
+        return list(results.values())
 
     def by_artist(self, artist: str) -> list[Song]:
         """Get songs by their artist, case-sensitive.
@@ -70,7 +199,7 @@ class MaimaiSongs:
         Returns:
             the list of songs that match the artist, return an empty list if no song is found.
         """
-        return [song for song in self.songs if song.artist == artist]
+        return list(self._artist_dict.get(artist, []))
 
     def by_genre(self, genre: str) -> list[Song]:
         """Get songs by their genre, case-sensitive.
@@ -80,8 +209,7 @@ class MaimaiSongs:
         Returns:
             the list of songs that match the genre, return an empty list if no song is found.
         """
-
-        return [song for song in self.songs if song.genre == genre]
+        return list(self._genre_dict.get(genre, []))
 
     def by_bpm(self, minimum: int, maximum: int) -> list[Song]:
         """Get songs by their BPM.
@@ -90,9 +218,11 @@ class MaimaiSongs:
             minimum: the minimum (inclusive) BPM of the songs.
             maximum: the maximum (inclusive) BPM of the songs.
         Returns:
-            the list of songs that match the BPM range, return an empty list if no song is found.
+            the list of songs that match the BPM range, sorted by BPM ascending, return an empty list if no song is found.
         """
-        return [song for song in self.songs if minimum <= song.bpm <= maximum]
+        lo = bisect.bisect_left(self._bpm_keys, minimum)
+        hi = bisect.bisect_right(self._bpm_keys, maximum)
+        return self._bpm_songs[lo:hi]
 
     def filter(self, **kwargs) -> list[Song]:
         """Filter songs by their attributes.
@@ -104,13 +234,28 @@ class MaimaiSongs:
         Returns:
             the list of songs that match all the conditions, return an empty list if no song is found.
         """
-        return [song for song in self.songs if all(getattr(song, key) == value for key, value in kwargs.items())]
+        # fail on unknown attributes up front, no matter whether any song is left to compare them on
+        for key in kwargs:
+            if key not in Song.__dataclass_fields__:
+                raise AttributeError(f"'Song' object has no attribute '{key}'")
+        indexes = {"title": self._title_dict, "artist": self._artist_dict, "genre": self._genre_dict}
+        # seed the candidates from the smallest indexed bucket, then check the remaining conditions on them only
+        # unhashable values can't be looked up in the indexes, they are left to the full scan
+        buckets = [(key, indexes[key].get(value, [])) for key, value in kwargs.items() if key in indexes and _is_hashable(value)]
+        if "id" in kwargs and _is_hashable(kwargs["id"]):
+            song = self._song_id_dict.get(kwargs["id"])
+            buckets.append(("id", [song] if song else []))
+        candidates = self.songs
+        if buckets:
+            seed_key, candidates = min(buckets, key=lambda bucket: len(bucket[1]))
+            kwargs = {key: value for key, value in kwargs.items() if key != seed_key}
+        return _filter_by_attributes(candidates, kwargs)
 
 
 class MaimaiPlates:
-    scores: list[Score] = []
+    scores: list[Score]
     """The scores that match the plate version and kind."""
-    songs: list[Song] = []
+    songs: list[Song]
     """The songs that match the plate version and kind."""
     version: str
     """The version of the plate, e.g. "真", "舞"."""
@@ -121,37 +266,27 @@ class MaimaiPlates:
         """@private"""
         version_str = enums.plate_aliases.get(version_str, version_str)
         kind = enums.plate_aliases.get(kind, kind)
-        if version_str == "真":
-            versions = [enums.plate_to_version["初"], enums.plate_to_version["真"]]
-        if version_str in ["霸", "舞"]:
-            versions = [ver for ver in enums.plate_to_version.values() if ver < 20000]
-        if enums.plate_to_version.get(version_str):
-            versions = [enums.plate_to_version[version_str]]
-        if not versions or kind not in ["将", "者", "极", "舞舞", "神"]:
+        versions = _plate_to_versions.get(version_str)
+        meets_requirement = _plate_predicates.get(kind)
+        if not versions or not meets_requirement:
             raise InvalidPlateError(f"Invalid plate: {version_str}{kind}")
 
         self.version = version_str
         self.kind = kind
-        scores_unique = {}
+        self._meets_requirement = meets_requirement
+        scores_unique: dict[tuple[int, SongType, LevelIndex], Score] = {}
+        get_unique = scores_unique.get
+        get_plate_versions = songs._get_plate_versions().get
 
         # There is no plate that requires the player to play both a certain beatmap's DX and SD
         for score in scores:
-            song = songs.by_id(score.id)
-            score_key = f"{score.id} {score.type} {score.level_index}"
-            if song.difficulties.standard != []:
-                if any(song.difficulties.standard[0].version % ver <= 100 for ver in versions):
-                    scores_unique[score_key] = score.compare(scores_unique.get(score_key, None))
-            if song.difficulties.dx != []:
-                if any(song.difficulties.dx[0].version % ver <= 100 for ver in versions):
-                    scores_unique[score_key] = score.compare(scores_unique.get(score_key, None))
+            song_versions = get_plate_versions(score.id)
+            if song_versions is None or song_versions.isdisjoint(versions):
+                continue  # skip scores of unknown songs or songs outside the plate
+            score_key = (score.id, score.type, score.level_index)
+            scores_unique[score_key] = score.compare(get_unique(score_key, None))
         # There is no plate that requires the player to play both a certain beatmap's DX and SD
-        for song in songs.songs:
-            if song.difficulties.standard != []:
-                if any(song.difficulties.standard[0].version % ver <= 100 for ver in versions):
-                    self.songs.append(song)
-            if song.difficulties.dx != []:
-                if any(song.difficulties.dx[0].version % ver <= 100 for ver in versions):
-                    self.songs.append(song)
+        self.songs = [song for song in songs.songs if not get_plate_versions(song.id).isdisjoint(versions)]
 
         self.scores = list(scores_unique.values())
 
@@ -163,6 +298,28 @@ class MaimaiPlates:
         """
         return self.version not in ["舞", "霸"]
 
+    @cached_property
+    def _classified(self) -> tuple[list[PlateObject], list[PlateObject], list[PlateObject]]:
+        # classify the scores into remained, cleared and played in a single pass
+        meets_requirement, skip_remaster = self._meets_requirement, self.no_remaster
+        remained = {song.id: PlateObject(song=song, levels=song.get_levels(skip_remaster), score=[]) for song in self.songs}
+        cleared = {song.id: PlateObject(song=song, levels=[], score=[]) for song in self.songs}
+        played = {song.id: PlateObject(song=song, levels=[], score=[]) for song in self.songs}
+        for score in self.scores:
+            if skip_remaster and score.level_index == LevelIndex.ReMASTER:
+                remained[score.id].score.append(score)  # skip ReMASTER scores if the plate is not 舞 or 霸
+                continue
+            played[score.id].score.append(score)
+            played[score.id].levels.append(score.level_index)
+            if meets_requirement(score):
+                cleared[score.id].score.append(score)
+                cleared[score.id].levels.append(score.level_index)
+                if score.level_index in remained[score.id].levels:
+                    remained[score.id].levels.remove(score.level_index)
+            else:
+                remained[score.id].score.append(score)
+        return tuple([plate for plate in results.values() if plate.levels != []] for results in (remained, cleared, played))
+
     @cached_property
     def remained(self) -> list[PlateObject]:
         """Get the remained songs and scores of the player on this plate.
@@ -171,29 +328,7 @@ class MaimaiPlates:
 
         The distinct scores which NOT met the plate requirement will be included in the result, the finished scores won't.
         """
-        scores: dict[int, list[Score]] = {}
-        [scores.setdefault(score.id, []).append(score) for score in self.scores]
-        results = {song.id: PlateObject(song=song, levels=song.get_levels(self.no_remaster), score=scores.get(song.id, [])) for song in self.songs}
-
-        def extract(score: Score) -> None:
-            if self.no_remaster and score.level_index == LevelIndex.ReMASTER:
-                return  # skip ReMASTER scores if the plate is not 舞 or 霸
-            results[score.id].score.remove(score)
-            if score.level_index in results[score.id].levels:
-                results[score.id].levels.remove(score.level_index)
-
-        if self.kind == "者":
-            [extract(score) for score in self.scores if score.rate.value <= RateType.A.value]
-        elif self.kind == "将":
-            [extract(score) for score in self.scores if score.rate.value <= RateType.SSS.value]
-        elif self.kind == "极":
-            [extract(score) for score in self.scores if score.fc and score.fc.value <= FCType.FC.value]
-        elif self.kind == "舞舞":
-            [extract(score) for score in self.scores if score.fs and score.fs.value <= FSType.FSD.value]
-        elif self.kind == "神":
-            [extract(score) for score in self.scores if score.fc and score.fc.value <= FCType.AP.value]
-
-        return [plate for plate in results.values() if plate.levels != []]
+        return self._classified[0]
 
     @cached_property
     def cleared(self) -> list[PlateObject]:
@@ -203,26 +338,7 @@ class MaimaiPlates:
 
         The distinct scores which met the plate requirement will be included in the result, the unfinished scores won't.
         """
-        results = {song.id: PlateObject(song=song, levels=[], score=[]) for song in self.songs}
-
-        def insert(score: Score) -> None:
-            if self.no_remaster and score.level_index == LevelIndex.ReMASTER:
-                return  # skip ReMASTER scores if the plate is not 舞 or 霸
-            results[score.id].score.append(score)
-            results[score.id].levels.append(score.level_index)
-
-        if self.kind == "者":
-            [insert(score) for score in self.scores if score.rate.value <= RateType.A.value]
-        elif self.kind == "将":
-            [insert(score) for score in self.scores if score.rate.value <= RateType.SSS.value]
-        elif self.kind == "极":
-            [insert(score) for score in self.scores if score.fc and score.fc.value <= FCType.FC.value]
-        elif self.kind == "舞舞":
-            [insert(score) for score in self.scores if score.fs and score.fs.value <= FSType.FSD.value]
-        elif self.kind == "神":
-            [insert(score) for score in self.scores if score.fc and score.fc.value <= FCType.AP.value]
-
-        return [plate for plate in results.values() if plate.levels != []]
+        return self._classified[1]
 
     @cached_property
     def played(self) -> list[PlateObject]:
@@ -232,13 +348,7 @@ class MaimaiPlates:
 
         All distinct scores will be included in the result.
         """
-        results = {song.id: PlateObject(song=song, levels=[], score=[]) for song in self.songs}
-        for score in self.scores:
-            if self.no_remaster and score.level_index == LevelIndex.ReMASTER:
-                continue  # skip ReMASTER scores if the plate is not 舞 or 霸
-            results[score.id].score.append(score)
-            results[score.id].levels.append(score.level_index)
-        return [plate for plate in results.values() if plate.levels != []]
+        return self._classified[2]
 
     @cached_property
     def all(self) -> list[PlateObject]:
@@ -248,23 +358,22 @@ class MaimaiPlates:
 
         No scores will be included in the result, use played, cleared, remained to get the scores.
         """
-        results = {song.id: PlateObject(song=song, levels=song.get_levels(self.no_remaster), score=[]) for song in self.songs}
-        return results.values()
+        return [PlateObject(song=song, levels=song.get_levels(self.no_remaster), score=[]) for song in self.songs]
 
     @cached_property
     def played_num(self) -> int:
         """Get the number of played levels on this plate."""
-        return len([level for plate in self.played for level in plate.levels])
+        return sum(len(plate.levels) for plate in self.played)
 
     @cached_property
     def cleared_num(self) -> int:
         """Get the number of cleared levels on this plate."""
-        return len([level for plate in self.cleared for level in plate.levels])
+        return sum(len(plate.levels) for plate in self.cleared)
 
     @cached_property
     def remained_num(self) -> int:
         """Get the number of remained levels on this plate."""
-        return len([level for plate in self.remained for level in plate.levels])
+        return sum(len(plate.levels) for plate in self.remained)
 
     @cached_property
     def all_num(self) -> int:
@@ -272,7 +381,7 @@ class MaimaiPlates:
 
         This is the total number of levels on the plate, should equal to `cleared_num + remained_num`.
         """
-        return len([level for plate in self.all for level in plate.levels])
+        return sum(len(plate.levels) for plate in self.all)
 
 
 class MaimaiScores:
@@ -291,10 +400,11 @@ class MaimaiScores:
 
     @staticmethod
     def _get_distinct_scores(scores: list[Score]) -> list[Score]:
-        scores_unique = {}
+        scores_unique: dict[tuple[int, SongType, LevelIndex], Score] = {}
+        get_unique = scores_unique.get
         for score in scores:
-            score_key = f"{score.id} {score.type} {score.level_index}"
-            scores_unique[score_key] = score.compare(scores_unique.get(score_key, None))
+            score_key = (score.id, score.type, score.level_index)
+            scores_unique[score_key] = score.compare(get_unique(score_key, None))
         return list(scores_unique.values())
 
     def __init__(self, b35: list[Score] = None, b15: list[Score] = None, all: list[Score] = None, songs: "MaimaiSongs" = None):
@@ -304,13 +414,13 @@ class MaimaiScores:
             distinct_scores = MaimaiScores._get_distinct_scores(all)  # scores have to be distinct to calculate the bests
             scores_new: list[Score] = []
             scores_old: list[Score] = []
+            get_song, current_version = songs._song_id_dict.get, enums.current_version
             for score in distinct_scores:
-                if song := songs.by_id(score.id):
-                    (scores_new if song.version >= enums.current_version else scores_old).append(score)
-            scores_old.sort(key=lambda score: (score.dx_rating, score.dx_score, score.achievements), reverse=True)
-            scores_new.sort(key=lambda score: (score.dx_rating, score.dx_score, score.achievements), reverse=True)
-            b35 = scores_old[:35]
-            b15 = scores_new[:15]
+                if song := get_song(score.id):
+                    (scores_new if song.version >= current_version else scores_old).append(score)
+            # only the top scores are needed, no need to sort all of them
+            b35 = heapq.nlargest(35, scores_old, key=lambda score: (score.dx_rating, score.dx_score, score.achievements))
+            b15 = heapq.nlargest(15, scores_new, key=lambda score: (score.dx_rating, score.dx_score, score.achievements))
         self.scores_b35 = b35
         self.scores_b15 = b15
         self.rating_b35 = sum(score.dx_rating for score in b35)
@@ -367,29 +477,35 @@ class MaimaiScores:
         Returns:
             the list of scores that match all the conditions, return an empty list if no score is found.
         """
-        return [score for score in self.scores if all(getattr(score, key) == value for key, value in kwargs.items())]
+        return _filter_by_attributes(self.scores, kwargs)
 
 
 class MaimaiClient:
     """The main client of maimai.py."""
 
-    _client: AsyncClient
+    __slots__ = ("_args", "_songs_tasks")
 
     def __init__(self, timeout: float = 20.0, **kwargs) -> None:
         """Initialize the maimai.py client.
 
+        HTTP/2 is enabled automatically if the optional `h2` package is installed, e.g. by `pip install httpx[http2]`.
+
         Args:
             timeout: the timeout of the requests, defaults to 20.0.
+            kwargs: other arguments passed to `httpx.AsyncClient`, e.g. `proxy`, `limits`, `http2`.
         """
-        self._args = {"timeout": timeout, **kwargs}
+        self._args = {"timeout": timeout, "http2": _http2_available, **kwargs}
+        self._songs_tasks: dict[tuple[type, type | None], asyncio.Task[MaimaiSongs]] = {}
 
     async def songs(
         self,
-        provider: ISongProvider = LXNSProvider(),
-        alias_provider: IAliasProvider = YuzuProvider(),
+        provider: ISongProvider | None = None,
+        alias_provider: IAliasProvider | None = _default_alias_provider,
     ) -> MaimaiSongs:
         """Fetch all maimai songs from the provider.
 
+        The songs are cached per provider and alias provider types for an hour, later calls with the same types will reuse them. Call `maimai_py.caches.clear_songs()` to fetch them again.
+
         Available providers: `DivingFishProvider`, `LXNSProvider`.
 
         Available alias providers: `YuzuProvider`, `LXNSProvider`.
@@ -402,16 +518,35 @@ class MaimaiClient:
         Raises:
             RequestError: Request failed due to network issues.
         """
+        provider = provider or _default_provider
+        # both the cache and the in-flight fetches are keyed by the provider types, so fresh provider instances share them too
+        key = (type(provider), type(alias_provider) if alias_provider else None)
+        if songs := caches.get_songs(key):
+            return songs
+        # concurrent calls with the same providers share one in-flight fetch, tasks can't be shared across event loops
+        task = self._songs_tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch_songs(provider, alias_provider, key))
+            self._songs_tasks[key] = task
+            task.add_done_callback(lambda done: self._songs_tasks.pop(key) if self._songs_tasks.get(key) is done else None)
+        # shield the shared fetch, so that one cancelled caller won't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_songs(self, provider: ISongProvider, alias_provider: IAliasProvider | None, key: tuple[type, type | None]) -> MaimaiSongs:
         async with httpx.AsyncClient(**self._args) as client:
-            aliases = await alias_provider.get_aliases(client) if alias_provider else None
-            songs = await provider.get_songs(client)
-            caches.cached_songs = MaimaiSongs(songs, aliases)
-            return caches.cached_songs
+            if alias_provider:
+                # songs and aliases are independent, fetch them concurrently
+                songs, aliases = await asyncio.gather(provider.get_songs(client), alias_provider.get_aliases(client))
+            else:
+                songs, aliases = await provider.get_songs(client), None
+            maimai_songs = MaimaiSongs(songs, aliases)
+            caches.put_songs(key, maimai_songs)
+            return maimai_songs
 
     async def players(
         self,
         identifier: PlayerIdentifier,
-        provider: IPlayerProvider = LXNSProvider(),
+        provider: IPlayerProvider | None = None,
     ) -> DivingFishPlayer | LXNSPlayer:
         """Fetch player data from the provider.
 
@@ -428,6 +563,7 @@ class MaimaiClient:
             PrivacyLimitationError: The user has not accepted the 3rd party to access the data.
             RequestError: Request failed due to network issues.
         """
+        provider = provider or _default_provider
         async with httpx.AsyncClient(**self._args) as client:
             return await provider.get_player(identifier, client)
 
@@ -435,7 +571,7 @@ class MaimaiClient:
         self,
         identifier: PlayerIdentifier,
         kind: ScoreKind = ScoreKind.BEST,
-        provider: IScoreProvider = LXNSProvider(),
+        provider: IScoreProvider | None = None,
     ) -> MaimaiScores:
         """Fetch player's scores from the provider.
 
@@ -460,6 +596,7 @@ class MaimaiClient:
             ArcadeError: Only for ArcadeProvider, the request failed due to the maimai arcade issues.
             RequestError: Request failed due to network issues.
         """
+        provider = provider or _default_provider
         # MaimaiScores should always cache b35 and b15 scores, in ScoreKind.ALL cases, we can calc the b50 scores from all scores.
         # But there is one exception, LXNSProvider's ALL scores are incomplete, which doesn't contain dx_rating and achievements, leading to sorting difficulties.
         # In this case, we should always fetch the b35 and b15 scores for LXNSProvider.
@@ -469,7 +606,7 @@ class MaimaiClient:
                 b35, b15 = await provider.get_scores_best(identifier, client)
             # For some cases, the provider doesn't support fetching b35 and b15 scores, we should fetch all scores instead.
             if kind == ScoreKind.ALL or (b35 == None and b15 == None):
-                songs = caches.cached_songs if caches.cached_songs else await self.songs()
+                songs = caches.get_songs() or await self.songs()
                 all = await provider.get_scores_all(identifier, client)
             return MaimaiScores(b35, b15, all, songs)
 
@@ -477,7 +614,7 @@ class MaimaiClient:
         self,
         identifier: PlayerIdentifier,
         scores: list[Score],
-        provider: IScoreProvider = LXNSProvider(),
+        provider: IScoreProvider | None = None,
     ) -> None:
         """Update player's scores to the provider.
 
@@ -499,6 +636,7 @@ class MaimaiClient:
             PrivacyLimitationError: The user has not accepted the 3rd party to access the data.
             RequestError: Request failed due to network issues.
         """
+        provider = provider or _default_provider
         async with httpx.AsyncClient(**self._args) as client:
             await provider.update_scores(identifier, scores, client)
 
@@ -506,7 +644,7 @@ class MaimaiClient:
         self,
         identifier: PlayerIdentifier,
         plate: str,
-        provider: IScoreProvider = LXNSProvider(),
+        provider: IScoreProvider | None = None,
     ) -> MaimaiPlates:
         """Get the plate achievement of the given player and plate.
 
@@ -523,8 +661,9 @@ class MaimaiClient:
             PrivacyLimitationError: The user has not accepted the 3rd party to access the data.
             RequestError: Request failed due to network issues.
         """
+        provider = provider or _default_provider
         async with httpx.AsyncClient(**self._args) as client:
-            songs = caches.cached_songs if caches.cached_songs else await self.songs()
+            songs = caches.get_songs() or await self.songs()
             scores = await provider.get_scores_all(identifier, client)
             return MaimaiPlates(scores, plate[0], plate[1:], songs)
 
@@ -552,18 +691,13 @@ class MaimaiClient:
         """
         async with httpx.AsyncClient() as client:
             if not all([r, t, code, state]):
-                resp = await client.get("https://tgk-wcaime.wahlap.com/wc_auth/oauth/authorize/maimai-dx")
+                resp = await client.get(_wechat_authorize_url)
                 return resp.headers["location"].replace("redirect_uri=https", "redirect_uri=http")
             params = {"r": r, "t": t, "code": code, "state": state}
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 6.1; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/81.0.4044.138 Safari/537.36 NetType/WIFI MicroMessenger/7.0.20.1781(0x6700143B) WindowsWechat(0x6307001e)",
-                "Host": "tgk-wcaime.wahlap.com",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
-            }
-            resp = await client.get("https://tgk-wcaime.wahlap.com/wc_auth/oauth/callback/maimai-dx", params=params, headers=headers, timeout=5)
+            resp = await client.get(_wechat_callback_url, params=params, headers=_wechat_headers, timeout=5)
             if resp.status_code != 302:
                 raise WechatTokenExpiredError("Wechat token is expired")
-            resp_next = await client.get(resp.next_request.url, headers=headers)
+            resp_next = await client.get(resp.next_request.url, headers=_wechat_headers)
             return PlayerIdentifier(credentials=resp_next.cookies)
 
     async def qrcode(self, qrcode: str) -> PlayerIdentifier:
@@ -55,10 +55,13 @@ class ArcadeProvider(IPlayerProvider, IScoreProvider):
             raise InvalidPlayerIdentifierError("Player identifier credentials should be provided.")
         resp: ArcadeResponse = await arcade.get_user_scores(identifier.credentials.encode())
         ArcadeResponse.throw_error(resp)
-        if not caches.cached_songs:
+        if not (songs := caches.get_songs()):
             # This breaks the abstraction of the provider, but we have no choice
-            caches.cached_songs = await LXNSProvider().get_songs(client)
-        return [ArcadeProvider._deser_score(score, caches.cached_songs) for score in resp.data]
+            from maimai_py.maimai import MaimaiSongs
+
+            songs = MaimaiSongs(await LXNSProvider().get_songs(client), None)
+            caches.put_songs((LXNSProvider, None), songs)
+        return [ArcadeProvider._deser_score(score, songs) for score in resp.data]
 
     async def get_scores_best(self, identifier: PlayerIdentifier, client: AsyncClient) -> tuple[list[Score], list[Score]]:
         # Return (None, None) will call the main client to handle this, which will then fetch all scores instead
@@ -67,10 +67,13 @@ class WechatProvider(IPlayerProvider, IScoreProvider):
     async def get_scores_all(self, identifier: PlayerIdentifier, client: AsyncClient) -> list[Score]:
         if not identifier.credentials:
             raise InvalidPlayerIdentifierError("Wahlap wechat cookies are required to fetch scores")
-        if not caches.cached_songs:
+        if not (songs := caches.get_songs()):
             # This breaks the abstraction of the provider, but we have no choice
-            caches.cached_songs = await LXNSProvider().get_songs(client)
-        scores = await self._crawl_scores(client, identifier.credentials, caches.cached_songs)
+            from maimai_py.maimai import MaimaiSongs
+
+            songs = MaimaiSongs(await LXNSProvider().get_songs(client), None)
+            caches.put_songs((LXNSProvider, None), songs)
+        scores = await self._crawl_scores(client, identifier.credentials, songs)
         return scores
 
     async def get_scores_best(self, identifier: PlayerIdentifier, client: AsyncClient):
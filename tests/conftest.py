@@ -1,11 +1,19 @@
 import os
 import pytest
 
+from maimai_py.enums import LevelIndex, SongType
 from maimai_py.maimai import MaimaiClient
+from maimai_py.models import Song, SongDifficulties, SongDifficulty
 from maimai_py.providers.divingfish import DivingFishProvider
 from maimai_py.providers.lxns import LXNSProvider
 
 
+def make_song(id: int, title: str | None = None, artist: str = "artist", genre: str = "genre", version: int = 10000) -> Song:
+    """Build an offline song with the four basic standard charts of its version."""
+    diffs = [SongDifficulty(SongType.STANDARD, LevelIndex(i), "10", 10.0, "", version, 0, 0, 0, 0, 0) for i in range(4)]
+    return Song(id, title or f"song{id}", artist, genre, 150, None, version, None, None, False, SongDifficulties(diffs, [], []))
+
+
 @pytest.fixture(scope="function")
 def maimai():
     return MaimaiClient()
@@ -0,0 +1,62 @@
+import pytest
+
+from maimai_py import caches
+from maimai_py.maimai import MaimaiSongs
+from maimai_py.providers import DivingFishProvider, LXNSProvider, YuzuProvider
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch):
+    clock = Clock()
+    monkeypatch.setattr(caches, "monotonic", clock)
+    caches.clear_songs()
+    yield clock
+    caches.clear_songs()
+
+
+def test_songs_cache_expires(clock: Clock):
+    songs = MaimaiSongs([], None)
+    caches.put_songs((LXNSProvider, YuzuProvider), songs)
+    clock.now = caches.songs_cache_ttl - 1
+    assert caches.get_songs((LXNSProvider, YuzuProvider)) is songs
+    assert caches.get_songs((LXNSProvider, None)) is None
+    clock.now = caches.songs_cache_ttl
+    assert caches.get_songs((LXNSProvider, YuzuProvider)) is None
+    assert caches.get_songs() is None
+
+
+def test_songs_cache_evicts_oldest(clock: Clock, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(caches, "songs_cache_size", 2)
+    songs1, songs2, songs3 = MaimaiSongs([], None), MaimaiSongs([], None), MaimaiSongs([], None)
+    caches.put_songs((LXNSProvider, None), songs1)
+    caches.put_songs((DivingFishProvider, None), songs2)
+    caches.put_songs((LXNSProvider, None), songs1)  # re-caching moves the key to the newest position
+    caches.put_songs((LXNSProvider, YuzuProvider), songs3)
+    assert caches.get_songs((DivingFishProvider, None)) is None
+    assert caches.get_songs((LXNSProvider, None)) is songs1
+    assert caches.get_songs((LXNSProvider, YuzuProvider)) is songs3
+
+
+def test_songs_cache_most_recent(clock: Clock):
+    songs1, songs2 = MaimaiSongs([], None), MaimaiSongs([], None)
+    assert caches.get_songs() is None
+    caches.put_songs((LXNSProvider, None), songs1)
+    clock.now = 10
+    caches.put_songs((DivingFishProvider, None), songs2)
+    assert caches.get_songs() is songs2
+    caches.put_songs((LXNSProvider, None), songs1)
+    assert caches.get_songs() is songs1
+    clock.now = caches.songs_cache_ttl + 10
+    assert caches.get_songs() is None
+    caches.put_songs((DivingFishProvider, None), songs2)
+    assert caches.get_songs() is songs2
+    caches.clear_songs()
+    assert caches.get_songs() is None
@@ -0,0 +1,12 @@
+from maimai_py.maimai import MaimaiPlates, MaimaiSongs
+from tests.conftest import make_song
+
+
+def test_plate_versions_exclude_dx_songs():
+    # 20000 is a multiple of 10000 and exactly 100 above FiNALE (19900), neither should count
+    songs = MaimaiSongs([make_song(1, version=10000), make_song(2, version=11000), make_song(3, version=20000), make_song(4, version=19900)], None)
+    assert sorted(song.id for song in MaimaiPlates([], "真", "将", songs).songs) == [1, 2]
+    assert sorted(song.id for song in MaimaiPlates([], "初", "将", songs).songs) == [1]
+    assert sorted(song.id for song in MaimaiPlates([], "舞", "将", songs).songs) == [1, 2, 4]
+    assert sorted(song.id for song in MaimaiPlates([], "辉", "将", songs).songs) == [4]
+    assert sorted(song.id for song in MaimaiPlates([], "熊", "将", songs).songs) == [3]
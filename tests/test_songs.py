@@ -11,9 +11,11 @@ async def test_songs_fetching(maimai: MaimaiClient, lxns: LXNSProvider, divingfi
     song1 = songs.by_id(1231)  # 生命不詳
     assert song1.title == "生命不詳"
     assert song1.difficulties.dx[3].note_designer == "はっぴー"
+    assert songs.by_title("生命不詳").id == song1.id
 
     song2 = songs.by_alias("不知死活")
     assert song2.id == song1.id
+    assert song1.id in [song.id for song in songs.by_alias_prefix("不知")]
 
     songs_lxns_provider = await maimai.songs(alias_provider=lxns)
     song3 = songs_lxns_provider.by_alias("星穹列车")
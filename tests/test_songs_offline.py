@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+
+from maimai_py import caches
+from maimai_py.maimai import MaimaiClient, MaimaiSongs
+from maimai_py.models import Song, SongAlias
+from maimai_py.providers import IAliasProvider, ISongProvider
+from tests.conftest import make_song
+
+
+@pytest.fixture()
+def songs() -> MaimaiSongs:
+    return MaimaiSongs([make_song(1, "a", "a"), make_song(2, "b", "a"), make_song(3, "b", "b")], None)
+
+
+def test_songs_by_title(songs: MaimaiSongs):
+    assert songs.by_title("b").id == 2
+    assert [song.id for song in songs.by_title_all("b")] == [2, 3]
+    assert songs.by_title_all("zz") == []
+    songs.by_title_all("b").clear()  # a copy, the index is untouched
+    assert len(songs.by_title_all("b")) == 2
+
+
+def test_songs_duplicated_ids():
+    # the later song wins on duplicated ids, the earlier one must not leak through the indexes
+    songs = MaimaiSongs([make_song(1, "a", "a"), make_song(1, "b", "b")], None)
+    assert [song.title for song in songs.songs] == ["b"]
+    assert songs.by_title_all("a") == [] and songs.by_artist("a") == []
+    assert songs.filter(title="a") == []
+    assert [song.title for song in songs.by_genre("genre")] == ["b"]
+
+
+def test_songs_filter(songs: MaimaiSongs):
+    assert [song.id for song in songs.filter(artist="a")] == [1, 2]
+    assert [song.id for song in songs.filter(artist="a", title="b")] == [2]
+    assert [song.id for song in songs.filter(genre="genre", bpm=150)] == [1, 2, 3]
+    assert songs.filter(artist="zz") == []
+    assert [song.id for song in songs.filter(id=2, title="b")] == [2]
+    assert songs.filter(id=4) == []
+
+
+def test_songs_filter_unhashable(songs: MaimaiSongs):
+    assert songs.filter(artist=["a"]) == []
+    assert songs.filter(title={"b": 1}, artist="b") == []
+    assert songs.filter(id=[1]) == []
+
+
+def test_songs_filter_unknown_attribute(songs: MaimaiSongs):
+    with pytest.raises(AttributeError):
+        songs.filter(artist="a", nonexist=1)
+    with pytest.raises(AttributeError):
+        songs.filter(artist="zz", nonexist=1)
+
+
+class StubSongProvider(ISongProvider):
+    fetches = 0
+
+    async def get_songs(self, client) -> list[Song]:
+        StubSongProvider.fetches += 1
+        await asyncio.sleep(0.01)
+        return [make_song(1, "a", "a")]
+
+
+class StubAliasProvider(IAliasProvider):
+    async def get_aliases(self, client) -> list[SongAlias]:
+        return [SongAlias(1, ["aa"])]
+
+
+@pytest.mark.asyncio()
+async def test_songs_fetching_shared(maimai: MaimaiClient):
+    caches.clear_songs()
+    StubSongProvider.fetches = 0
+    # separate provider instances of the same types share one in-flight fetch
+    results = await asyncio.gather(*(maimai.songs(StubSongProvider(), StubAliasProvider()) for _ in range(3)))
+    assert StubSongProvider.fetches == 1
+    assert all(songs is results[0] for songs in results)
+    assert results[0].by_alias("aa").id == 1
+    caches.clear_songs()